@@ -1,3 +1,4 @@
+from fractions import Fraction
 import typing
 
 
@@ -7,70 +8,71 @@ class Account:
 
     Attributes:
         name (str): The name of the account holder.
-        balance (float): The balance of the account.
+        balance (int): The balance of the account in cents.
     """
 
-    def __init__(self, name: str, balance: float = 0.0) -> None:
+    __slots__ = ("_name", "_balance")
+
+    def __init__(self, name: str, balance: int = 0) -> None:
         """
         Initialize an Account instance.
 
         Args:
             name (str): The account holder's name.
-            balance (float, optional): The initial balance. Defaults to 0.0.
+            balance (int, optional): The initial balance in cents. Defaults to 0.
         """
-        self.__account_name: str = name
-        self.__account_balance: float = balance
-        self.set_balance(balance)
+        self._name: str = name
+        self._balance: int = balance if balance >= 0 else 0
 
-    def deposit(self, amount: float) -> bool:
+    def deposit(self, amount: int) -> bool:
         """
         Deposit an amount into the account.
 
         Args:
-            amount (float): The amount to deposit.
+            amount (int): The amount to deposit in cents.
 
         Returns:
             bool: True if deposit is successful, False otherwise.
         """
-        if amount > 0:
-            self.__account_balance += amount
-            return True
-        return False
+        if amount <= 0:
+            return False
+        self._balance += amount
+        return True
 
-    def withdraw(self, amount: float) -> bool:
+    def withdraw(self, amount: int) -> bool:
         """
         Withdraw an amount from the account.
 
         Args:
-            amount (float): The amount to withdraw.
+            amount (int): The amount to withdraw in cents.
 
         Returns:
             bool: True if withdrawal is successful, False otherwise.
         """
-        if amount > 0 and amount <= self.get_balance():
-            self.__account_balance -= amount
-            return True
-        return False
+        if amount <= 0 or amount > self._balance:
+            return False
+        self._balance -= amount
+        return True
 
     def get_name(self) -> str:
         """Returns the name of the account holder."""
-        return self.__account_name
+        return self._name
 
-    def get_balance(self) -> float:
-        """Returns the balance of the account."""
-        return self.__account_balance
+    def get_balance(self) -> int:
+        """Returns the balance of the account in cents."""
+        return self._balance
 
-    def set_balance(self, value: float) -> None:
+    def set_balance(self, value: int) -> None:
         """
         Set the account balance.
 
         Args:
-            value (float): The new balance value. Must be non-negative.
+            value (int): The new balance value in cents. Must be non-negative.
         """
         if value >= 0:
-            self.__account_balance = value
+            self._balance = value
         else:
-            self.__account_balance = 0
+            self._balance = 0
 
     def set_name(self, value: str) -> None:
         """
@@ -79,11 +81,11 @@ class Account:
         Args:
             value (str): The new name of the account holder.
         """
-        self.__account_name = value
+        self._name = value
 
     def __str__(self) -> str:
         """String representation of the account."""
-        return f"Account name = {self.get_name()}, Account balance = {self.get_balance():.2f}"
+        return f"Account name = {self.get_name()}, Account balance = {self.get_balance() / 100:.2f}"
 
 
 class SavingsAccount(Account):
@@ -91,12 +93,18 @@ class SavingsAccount(Account):
     Represents a savings account that applies interest every 5 deposits.
 
     Attributes:
-        MINIMUM (float): The minimum balance required for the account.
+        MINIMUM (int): The minimum balance required for the account in cents.
         RATE (float): The interest rate applied on the balance.
     """
 
-    MINIMUM: float = 100.0
+    __slots__ = ("_deposit_count", "_next_interest")
+
+    MINIMUM: int = 10000
     RATE: float = 0.02
+    _INTEREST_RATIO: Fraction = 1 + Fraction(str(RATE))
+    _INTEREST_NUM: int = _INTEREST_RATIO.numerator
+    _INTEREST_DEN: int = _INTEREST_RATIO.denominator
+    _INTEREST_EVERY: int = 5
 
     def __init__(self, name: str) -> None:
         """
@@ -106,55 +114,55 @@ class SavingsAccount(Account):
             name (str): The account holder's name.
         """
         super().__init__(name, self.MINIMUM)
-        self.__deposit_count: int = 0
+        self._deposit_count: int = 0
+        self._next_interest: int = self._INTEREST_EVERY
 
     def apply_interest(self) -> None:
         """Applies interest to the account balance."""
-        self.set_balance(self.get_balance() + (self.get_balance() * self.RATE))
+        self._balance = self._balance * self._INTEREST_NUM // self._INTEREST_DEN
 
-    def deposit(self, amount: float) -> bool:
+    def deposit(self, amount: int) -> bool:
         """
         Deposit an amount into the savings account and apply interest after every 5 deposits.
 
         Args:
-            amount (float): The amount to deposit.
+            amount (int): The amount to deposit in cents.
 
         Returns:
             bool: True if deposit is successful, False otherwise.
         """
-        if amount > 0:
-            self.__deposit_count += 1
-            super().deposit(amount)
-            if self.__deposit_count % 5 == 0:
-                self.apply_interest()
-            return True
-        return False
+        if amount <= 0:
+            return False
+        self._deposit_count += 1
+        self._balance += amount
+        if self._deposit_count == self._next_interest:
+            self.apply_interest()
+            self._next_interest += self._INTEREST_EVERY
+        return True
 
-    def withdraw(self, amount: float) -> bool:
+    def withdraw(self, amount: int) -> bool:
         """
         Withdraw an amount from the savings account.
 
         Args:
-            amount (float): The amount to withdraw.
+            amount (int): The amount to withdraw in cents.
 
         Returns:
             bool: True if withdrawal is successful, False otherwise.
         """
-        if amount > 0 and (self.get_balance() - amount) >= self.MINIMUM:
-            return super().withdraw(amount)
-        return False
+        if amount <= 0 or self._balance - amount < self.MINIMUM:
+            return False
+        self._balance -= amount
+        return True
 
-    def set_balance(self, value: float) -> None:
+    def set_balance(self, value: int) -> None:
         """
         Sets the savings account balance.
 
         Args:
-            value (float): The new balance value.
+            value (int): The new balance value in cents. Raised to MINIMUM if lower.
         """
-        if value < self.MINIMUM:
-            self.__account_balance = self.MINIMUM
-        else:
-            super().set_balance(value)
+        super().set_balance(max(value, self.MINIMUM))
 
     def get_deposit_counter(self) -> int:
         """
@@ -163,8 +171,8 @@ class SavingsAccount(Account):
         Returns:
             int: The deposit counter.
         """
-        return self.__deposit_count
+        return self._deposit_count
 
     def __str__(self) -> str:
         """Savings account info."""
-        return f"SAVING ACCOUNT: Account name = {self.get_name()}, Account balance = {self.get_balance():.2f}"
+        return f"SAVING ACCOUNT: Account name = {self.get_name()}, Account balance = {self.get_balance() / 100:.2f}"
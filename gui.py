@@ -2,7 +2,7 @@ from PyQt6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QFormLayout, QHBoxLayout, QVBoxLayout, 
     QPushButton, QMessageBox, QInputDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from logic import check_account, add_user, get_user_details, set_account_details
 from accounts import Account, SavingsAccount
 import typing
@@ -20,6 +20,24 @@ class LoginWindow(QWidget):
         super().__init__()
         self.setWindowTitle("Login")
         self.resize(600, 400)
+        self._built: bool = False
+
+    def showEvent(self, event) -> None:
+        """
+        Build the widgets the first time the window is shown.
+
+        Args:
+            event: The show event.
+        """
+        if not self._built:
+            self._build_ui()
+        super().showEvent(event)
+
+    def _build_ui(self) -> None:
+        """
+        Create the login form and buttons.
+        """
+        self._built = True
 
         user_label = QLabel("Username:")
         self.user_input: QLineEdit = QLineEdit()
@@ -120,8 +138,34 @@ class DashboardWindow(QWidget):
             self.savings_account = SavingsAccount(username)
             self.savings_account.set_balance(savings_balance)
 
+        self._dirty: bool = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.save_account_info)
+        self._built: bool = False
+
+    def showEvent(self, event) -> None:
+        """
+        Build the widgets the first time the window is shown.
 
-        self.title_label = QLabel(f"Welcome {username}")
+        Args:
+            event: The show event.
+        """
+        if not self._built:
+            self._build_ui()
+        super().showEvent(event)
+
+    def _build_ui(self) -> None:
+        """
+        Create the balance labels, action buttons and amount dialogs.
+        """
+        self._built = True
+
+        self._deposit_dialog = self._make_amount_dialog()
+        self._withdraw_dialog = self._make_amount_dialog()
+
+        self.title_label = QLabel(f"Welcome {self.username}")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.title_label.setStyleSheet("font-size: 24px; font-weight: bold; margin-bottom: 20px;")
 
@@ -129,14 +173,14 @@ class DashboardWindow(QWidget):
         self.account_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.account_label.setStyleSheet("font-size: 16px; font-weight: bold;")
 
-        self.account_balance_label = QLabel(f"${self.account.get_balance():.2f}")
+        self.account_balance_label = QLabel(f"${self.account.get_balance() / 100:.2f}")
         self.account_balance_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.savings_label = QLabel("Savings Balance")
         self.savings_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.savings_label.setStyleSheet("font-size: 16px; font-weight: bold;")
 
-        self.savings_balance_label = QLabel("N/A" if not self.savings_account else f"${self.savings_account.get_balance():.2f}")
+        self.savings_balance_label = QLabel("N/A" if not self.savings_account else f"${self.savings_account.get_balance() / 100:.2f}")
         self.savings_balance_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         balances_layout = QVBoxLayout()
@@ -193,22 +237,69 @@ class DashboardWindow(QWidget):
 
         self.setLayout(main_layout)
 
+    def _make_amount_dialog(self) -> QInputDialog:
+        """
+        Create a reusable dialog for entering dollar amounts.
+
+        Returns:
+            QInputDialog: The dialog, set up for two-decimal input.
+        """
+        dialog = QInputDialog(self)
+        dialog.setInputMode(QInputDialog.InputMode.DoubleInput)
+        dialog.setDoubleDecimals(2)
+        dialog.setDoubleMinimum(0)
+        return dialog
+
+    def _ask_amount(
+        self, dialog: QInputDialog, title: str, label: str, value: float = 0, minimum: float = 0
+    ) -> tuple[float, bool]:
+        """
+        Show an amount dialog and return the entered value.
+
+        Args:
+            dialog: The dialog to show.
+            title: The window title.
+            label: The prompt text.
+            value: The starting value.
+            minimum: The lowest value allowed.
+
+        Returns:
+            tuple[float, bool]: The amount and whether the dialog was accepted.
+        """
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setDoubleMinimum(minimum)
+        dialog.setDoubleValue(value)
+        ok = dialog.exec() == QInputDialog.DialogCode.Accepted
+        return dialog.doubleValue(), ok
+
     def update_account_info(self) -> None:
         """
-        Update the account and savings balances and save them.
+        Update the account and savings balances and schedule them to be saved.
         """
-        self.account_balance_label.setText(f"${self.account.get_balance():.2f}")
+        self.account_balance_label.setText(f"${self.account.get_balance() / 100:.2f}")
         self.savings_balance_label.setText(
-            "N/A" if not self.savings_account else f"${self.savings_account.get_balance():.2f}"
+            "N/A" if not self.savings_account else f"${self.savings_account.get_balance() / 100:.2f}"
         )
-        set_account_details(self.username, self.account, self.deposit_counter, self.savings_account or SavingsAccount(self.username))
+        self._dirty = True
+        self._save_timer.start()
+
+    def save_account_info(self) -> None:
+        """
+        Save the account and savings balances if they changed since the last save.
+        """
+        self._save_timer.stop()
+        if not self._dirty:
+            return
+        set_account_details(self.username, self.account, self.deposit_counter, self.savings_account)
+        self._dirty = False
 
     def deposit_to_main(self) -> None:
         """
         Deposit funds to the main account.
         """
-        amount, ok = QInputDialog.getDouble(self, "Deposit", "Enter amount to deposit:", value=0, min=0)
-        if ok and self.account.deposit(amount):
+        amount, ok = self._ask_amount(self._deposit_dialog, "Deposit", "Enter amount to deposit:")
+        if ok and self.account.deposit(round(amount * 100)):
             self.deposit_counter += 1
             self.update_account_info()
         else:
@@ -218,8 +309,8 @@ class DashboardWindow(QWidget):
         """
         Withdraw funds from the main account.
         """
-        amount, ok = QInputDialog.getDouble(self, "Withdraw", "Enter amount to withdraw:", value=0, min=0)
-        if ok and self.account.withdraw(amount):
+        amount, ok = self._ask_amount(self._withdraw_dialog, "Withdraw", "Enter amount to withdraw:")
+        if ok and self.account.withdraw(round(amount * 100)):
             self.update_account_info()
         else:
             QMessageBox.warning(self, "Error", "Insufficient funds.")
@@ -232,8 +323,8 @@ class DashboardWindow(QWidget):
             QMessageBox.warning(self, "Error", "You do not have a savings account!")
             return
 
-        amount, ok = QInputDialog.getDouble(self, "Deposit to Savings", "Enter amount to deposit:", value=0, min=0)
-        if ok and self.savings_account.deposit(amount):
+        amount, ok = self._ask_amount(self._deposit_dialog, "Deposit to Savings", "Enter amount to deposit:")
+        if ok and self.savings_account.deposit(round(amount * 100)):
             self.update_account_info()
         else:
             QMessageBox.warning(self, "Error", "Deposit to savings failed.")
@@ -246,8 +337,8 @@ class DashboardWindow(QWidget):
             QMessageBox.warning(self, "Error", "You do not have a savings account!")
             return
 
-        amount, ok = QInputDialog.getDouble(self, "Withdraw from Savings", "Enter amount to withdraw:", value=0, min=0)
-        if ok and self.savings_account.withdraw(amount):
+        amount, ok = self._ask_amount(self._withdraw_dialog, "Withdraw from Savings", "Enter amount to withdraw:")
+        if ok and self.savings_account.withdraw(round(amount * 100)):
             self.update_account_info()
         else:
             QMessageBox.warning(self, "Error", "Insufficient funds.")
@@ -260,12 +351,12 @@ class DashboardWindow(QWidget):
             QMessageBox.warning(self, "Error", "Savings account already exists!")
             return
 
-        initial_balance, ok = QInputDialog.getDouble(
-            self, "Create Savings Account", "Enter initial balance (minimum $100):", value=100, min=100
+        initial_balance, ok = self._ask_amount(
+            self._deposit_dialog, "Create Savings Account", "Enter initial balance (minimum $100):", value=100, minimum=100
         )
         if ok:
             self.savings_account = SavingsAccount(self.account.get_name())
-            self.savings_account.set_balance(initial_balance)
+            self.savings_account.set_balance(round(initial_balance * 100))
             self.update_account_info()
 
     def logout(self) -> None:
@@ -274,4 +365,14 @@ class DashboardWindow(QWidget):
         """
         self.login_window = LoginWindow()
         self.login_window.show()
-        self.close()
\ No newline at end of file
+        self.close()
+
+    def closeEvent(self, event) -> None:
+        """
+        Save any pending changes before the window closes.
+
+        Args:
+            event: The close event.
+        """
+        self.save_account_info()
+        super().closeEvent(event)
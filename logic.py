@@ -1,8 +1,90 @@
 import csv
+import hashlib
+import hmac
+import os
+import sqlite3
 from accounts import Account, SavingsAccount
 import typing
 
 
+_DATA_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dont_look")
+_DB_PATH: str = os.path.join(_DATA_DIR, "users.db")
+_CSV_PATH: str = os.path.join(_DATA_DIR, "users.csv")
+_FIELDNAMES: tuple[str, ...] = ("user", "password", "balance", "deposit_counter", "savings_balance")
+_INSERT_SQL: str = (
+    f"INSERT OR IGNORE INTO users ({', '.join(_FIELDNAMES)}) "
+    f"VALUES ({', '.join('?' * len(_FIELDNAMES))})"
+)
+
+_CONN = sqlite3.connect(_DB_PATH, isolation_level=None, check_same_thread=False)
+_CONN.execute("PRAGMA journal_mode=WAL")
+_CONN.execute("PRAGMA synchronous=NORMAL")
+_CONN.execute(
+    "CREATE TABLE IF NOT EXISTS users("
+    "user TEXT PRIMARY KEY, password TEXT, balance INTEGER, "
+    "deposit_counter INTEGER, savings_balance INTEGER) WITHOUT ROWID"
+)
+
+_user_cache: dict[str, tuple[int, int, int]] = {}
+
+
+def _hash_password(password: str, salt: bytes | None = None) -> str:
+    """
+    Hash a password with a random salt.
+
+    Args:
+        password: The plaintext password.
+        salt: The salt to use. A new one is made if not given.
+
+    Returns:
+        str: The salt and SHA-256 digest as "salt:digest" in hex.
+    """
+    if salt is None:
+        salt = os.urandom(16)
+    digest = hashlib.sha256(salt + password.encode()).digest()
+    return f"{salt.hex()}:{digest.hex()}"
+
+
+def _import_csv() -> None:
+    """
+    Copy the users from the old users.csv file into an empty database.
+    Balances in the CSV are in dollars and are stored as cents.
+    """
+    if _CONN.execute("SELECT 1 FROM users LIMIT 1").fetchone() is not None:
+        return
+
+    try:
+        with open(_CSV_PATH, "r", newline="") as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            u_idx, p_idx, b_idx, d_idx, s_idx = (header.index(name) for name in _FIELDNAMES)
+            rows = [
+                (
+                    row[u_idx],
+                    _hash_password(row[p_idx]),
+                    round(float(row[b_idx]) * 100),
+                    int(row[d_idx]),
+                    round(float(row[s_idx]) * 100),
+                )
+                for row in reader
+                if row
+            ]
+    except FileNotFoundError:
+        return
+    except (IndexError, ValueError):
+        print("Error: Invalid CSV Form.")
+        return
+
+    with _CONN:
+        _CONN.execute("BEGIN")
+        _CONN.executemany(_INSERT_SQL, rows)
+
+
+_import_csv()
+
+
 def check_account(user: str, password: str) -> bool:
     """
     Check if a user with the username and password exists.
@@ -15,15 +97,15 @@ def check_account(user: str, password: str) -> bool:
         bool: True if the user exists and the password matches.
     """
     try:
-        with open("dont_look/users.csv", "r") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                if row["user"] == user and row["password"] == password:
-                    return True
-    except FileNotFoundError:
-        print("Error: users.csv file not found.")
-    except KeyError:
-        print("Error: Invalid CSV Form.")
+        row = _CONN.execute("SELECT password FROM users WHERE user = ?", (user,)).fetchone()
+        if row is None:
+            return False
+
+        stored: str = row[0]
+        salt, _, _ = stored.partition(":")
+        return hmac.compare_digest(stored, _hash_password(password, bytes.fromhex(salt)))
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Error: {e}")
     return False
 
 
@@ -37,41 +119,13 @@ def add_user(user: str, password: str) -> None:
 
     Raises:
         ValueError: If the username already exists.
-        Exception: For any other issue writing to the file.
+        Exception: For any other issue writing to the database.
     """
     try:
-        user_exists = False
-        try:
-            with open("dont_look/users.csv", "r") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row["user"] == user:
-                        user_exists = True
-                        break
-        except FileNotFoundError:
-            pass
-
-        if user_exists:
-            raise ValueError(f"Username '{user}' already exists. Please choose a different username.")
+        cursor = _CONN.execute(_INSERT_SQL, (user, _hash_password(password), 0, 0, 0))
 
-        with open("dont_look/users.csv", "a", newline="") as file:
-            writer = csv.DictWriter(
-                file,
-                fieldnames=["user", "password", "balance", "deposit_counter", "savings_balance"],
-            )
-
-            if file.tell() == 0:
-                writer.writeheader()
-
-            writer.writerow(
-                {
-                    "user": user,
-                    "password": password,
-                    "balance": 0.0,
-                    "deposit_counter": 0,
-                    "savings_balance": 0.0,
-                }
-            )
+        if cursor.rowcount == 0:
+            raise ValueError(f"Username '{user}' already exists. Please choose a different username.")
 
     except ValueError as e:
         print(e)
@@ -83,7 +137,7 @@ def add_user(user: str, password: str) -> None:
 
 def get_user_details(user: str):
     """
-    Retrieve account details for a user.
+    Retrieve account details for a user. Results are cached for the rest of the session.
 
     Args:
         user: The username of the user to retrieve details for.
@@ -91,72 +145,57 @@ def get_user_details(user: str):
     Returns:
             - An Account object for the user.
             - The deposit counter value (int).
-            - The savings account balance (float).
+            - The savings account balance in cents (int).
 
     Raises:
-        FileNotFoundError: If the CSV file is not found.
-        KeyError: If the CSV header is broken.
         ValueError: If the user is not found.
     """
-    try:
-        with open("dont_look/users.csv", "r") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                if row["user"] == user:
-                    balance = float(row["balance"])
-                    deposit_counter = int(row["deposit_counter"])
-                    savings_balance = float(row["savings_balance"])
-                    return Account(user, balance), deposit_counter, savings_balance
-    except FileNotFoundError:
-        print("Error: users.csv file not found.")
-    except KeyError:
-        print("Error: Invalid CSV.")
-    raise ValueError("User not found")
+    if user not in _user_cache:
+        try:
+            row = _CONN.execute(
+                "SELECT balance, deposit_counter, savings_balance FROM users WHERE user = ?",
+                (user,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error: {e}")
+            row = None
+        if row is None:
+            raise ValueError("User not found")
+        _user_cache[user] = row
+
+    balance, deposit_counter, savings_balance = _user_cache[user]
+    return Account(user, balance), deposit_counter, savings_balance
 
 
 def set_account_details(
-    user: str, account: Account, deposit_counter: int, savings_account: SavingsAccount
+    user: str, account: Account, deposit_counter: int, savings_account: SavingsAccount | None
 ) -> None:
     """
     Update account, deposit counter, and savings account details for a user in the database.
+    Only the user's own row is written.
 
     Args:
         user : The username.
         account: The user's main account object.
         deposit_counter: The updated deposit counter for the savings account.
-        savings_account: The user's savings account object.
-
-    Raises:
-        FileNotFoundError: If the CSV file is not found.
-        Exception: If there is any other issue writing to the file.
+        savings_account: The user's savings account object, or None to store zeros.
     """
-    updated_rows = []
+    if savings_account is None:
+        savings_deposit_counter, savings_balance = 0, 0
+    else:
+        savings_deposit_counter = savings_account.get_deposit_counter()
+        savings_balance = savings_account.get_balance()
+
     try:
-        with open("dont_look/users.csv", "r") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                if row["user"] == user:
-                    row["balance"] = str(account.get_balance())
-                    row["deposit_counter"] = str(
-                        savings_account.get_deposit_counter()
-                    )
-                    row["savings_balance"] = str(savings_account.get_balance())
-                updated_rows.append(row)
-
-        with open("dont_look/users.csv", "w", newline="") as file:
-            writer = csv.DictWriter(
-                file,
-                fieldnames=[
-                    "user",
-                    "password",
-                    "balance",
-                    "deposit_counter",
-                    "savings_balance",
-                ],
-            )
-            writer.writeheader()
-            writer.writerows(updated_rows)
-    except FileNotFoundError:
-        print("Error: users.csv file not found.")
-    except Exception as e:
+        cursor = _CONN.execute(
+            "UPDATE users SET balance = ?, deposit_counter = ?, savings_balance = ? WHERE user = ?",
+            (account.get_balance(), savings_deposit_counter, savings_balance, user),
+        )
+        if cursor.rowcount == 0:
+            print(f"Error: User '{user}' not found.")
+            _user_cache.pop(user, None)
+        else:
+            _user_cache[user] = (account.get_balance(), savings_deposit_counter, savings_balance)
+    except sqlite3.Error as e:
         print(f"Error: {e}")
+        _user_cache.pop(user, None)